@@ -19,10 +19,131 @@ Persistence format (JSON):
     ...
   }
 }
+
+Optional dependencies (used automatically when installed, plain Python otherwise):
+- orjson: fast JSON encode/decode for save_json / load_json.
+- msgpack: binary save_msgpack / load_msgpack (save/load pick it for .msgpack/.mp paths).
+- numba (with numpy): compiled kernel behind GradeManager.bulk_gpas, loaded on its first call
+  (or ahead of time with warm_up_bulk_gpas()).
 """
 from __future__ import annotations
 import json
-from typing import Dict, List, Optional
+import math
+import os
+import re
+import sys
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from functools import partial
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+from urllib.parse import quote, unquote
+
+try:
+    import orjson as _fastjson # Optional: much faster JSON encode/decode if installed
+except ImportError:
+    _fastjson = None
+
+try:
+    import ijson as _ijson # Optional: streaming parser for very large JSON files
+except ImportError:
+    _ijson = None
+
+try:
+    import msgpack as _msgpack # Optional: binary save/load format
+except ImportError:
+    _msgpack = None
+
+_WRITE_BUFFER = 1 << 20 # 1 MiB write buffer so saves hit the disk in a few large chunks
+_STREAM_LOAD_MIN = 1_000_000 # Files at least this many bytes are parsed incrementally with ijson
+_MSGPACK_EXTS = (".msgpack", ".mp") # File extensions save()/load() treat as msgpack; anything else is JSON
+_GPA_CUTOFFS = (60, 70, 80, 90) # Lowest average earning 1, 2, 3 and 4 GPA points
+
+# ----------------------------
+# Bulk numeric kernels (numba)
+# ----------------------------
+# numba (which always brings numpy) is imported and the kernels compiled on the first
+# GradeManager.bulk_gpas() call, not at import: the menu never needs them and would
+# otherwise pay numba's start-up cost every time. A script that wants that cost paid
+# up front, not by its first bulk_gpas() call, calls warm_up_bulk_gpas() at start-up.
+# bulk_gpas falls back to calling Student.gpa() for every student when numba isn't installed.
+_kernels_loaded: Optional[bool] = None # None = not tried yet, False = numba isn't installed
+
+def _bulk_kernel():
+    # Returns the compiled _compute_gpas kernel (importing numba and defining the kernels
+    # on the first call), or None without numba. Everything is bound as a module global
+    # so the kernels can reach each other and numba can cache them on disk.
+    global _kernels_loaded, _np, _prange, _GPA_TABLE, _gpa_from_avgs, _compute_gpas
+    if _kernels_loaded is None:
+        try:
+            import numpy as _np
+            from numba import njit, prange as _prange
+        except ImportError:
+            _kernels_loaded = False
+            return None
+
+        # GPA points indexed by int(avg) // 10: 0-59 -> 0, 60s -> 1, ..., 90-100+ -> 4.
+        # Same mapping as _GPA_CUTOFFS, as a branchless lookup for the kernels.
+        _GPA_TABLE = _np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 2.0, 3.0, 4.0, 4.0])
+
+        @njit("f8(f8[:])", cache=True)
+        def _gpa_from_avgs(avgs):
+            # GPA for one student from their course averages (NaN = course has no grades).
+            # Same 90/80/70/60 scale as Student.gpa(), looked up in _GPA_TABLE instead of
+            # walking a ladder of compares.
+            total = 0.0
+            n = 0
+            for avg in avgs:
+                if _np.isnan(avg):
+                    continue
+                total += _GPA_TABLE[int(min(max(avg, 0.0), 100.0)) // 10] # Clamp before int(): huge averages overflow int64
+                n += 1
+            return total / n if n else _np.nan
+
+        @njit("f8[:](f8[::1], i8[::1], i8[::1])", cache=True, parallel=True)
+        def _compute_gpas(sums, counts, s_offsets):
+            # sums[c] and counts[c] are course c's grade total (Course.total()) and number of
+            # grades, and student s owns courses s_offsets[s]:s_offsets[s + 1]. The grades are
+            # not re-added here: dividing the same exactly rounded totals Course.average() uses
+            # keeps every GPA equal to Student.gpa(), even for averages right on a cutoff.
+            # Returns one GPA per student, NaN where the student has no grades.
+            n_courses = sums.size
+            means = _np.empty(n_courses)
+            for c in _prange(n_courses):
+                means[c] = sums[c] / counts[c] if counts[c] else _np.nan
+            n_students = s_offsets.size - 1
+            gpas = _np.empty(n_students)
+            for s in _prange(n_students):
+                gpas[s] = _gpa_from_avgs(means[s_offsets[s]:s_offsets[s + 1]])
+            return gpas
+
+        _kernels_loaded = True
+    return _compute_gpas if _kernels_loaded else None
+
+def warm_up_bulk_gpas() -> bool:
+    # Imports numba and loads the bulk_gpas kernels now. Returns False if numba isn't installed.
+    return _bulk_kernel() is not None
+
+# ----------------------------
+# Exact sums
+# ----------------------------
+# Course.add_grade keeps a plain running total and only checks it exactly once it gets
+# this large: below it the rounding error of the running total is far too small to
+# hide an overflow, so the cheap total can't accept a grade the exact one would reject.
+_EXACT_CHECK_ABOVE = 1e300
+
+# Exact total of grades (a packed array or any iterable of floats) that also validates
+# them: a NaN or infinite grade, or an overflowing total, can only give a non-finite
+# result (or make fsum raise), so loading needs no separate per-grade isfinite sweep --
+# fsum's single C loop does both jobs.
+def _checked_fsum(grades: Iterable[float]) -> float:
+    try:
+        total = math.fsum(grades)
+    except (ValueError, OverflowError): # inf + -inf, or finite grades too large to add
+        raise ValueError("Grade must be numeric.") from None
+    if not math.isfinite(total):
+        raise ValueError("Grade must be numeric.")
+    return total
 
 # ----------------------------
 # Class: Course
@@ -30,41 +151,99 @@ from typing import Dict, List, Optional
 # Represents a single course that a student is enrolled in.
 # Each course has a name and a list of grades for that student.
 class Course:
-    def __init__(self, name: str):
-        self.name = name # Name the course the name given by user
-        self.grades: List[float] = [] # Array to store multiple grades for this course
+    __slots__ = ("name", "grades", "_sum", "_exact", "_grades_repr_cache", "_owner") # No per-instance __dict__
+
+    def __init__(self, name: str, owner: Optional[Student] = None):
+        self.name = sys.intern(name) # Name the course the name given by user (interned, shared across students)
+        self.grades = array("d") # Packed array of doubles storing the grades for this course
+        self._sum = 0.0 # Running total of grades so average() doesn't re-add them every call
+        self._exact = True # _sum equals math.fsum(self.grades); add_grade clears it
+        self._grades_repr_cache: Optional[str] = None # Display text for grades, built on demand
+        self._owner = owner # Student whose cached GPA depends on these grades, if any
 
     def add_grade(self, grade: float) -> None:
-        # Adds grade to certain course
-        if not isinstance(grade, (int, float)):
-            raise ValueError("Grade must be numeric.")
-        self.grades.append(float(grade))
+        # Adds grade to certain course. float() itself rejects anything non-numeric.
+        try:
+            g = float(grade)
+        except (TypeError, ValueError):
+            raise ValueError("Grade must be numeric.") from None
+        total = self._sum + g
+        if -_EXACT_CHECK_ABOVE < total < _EXACT_CHECK_ABOVE:
+            self._exact = False # total() / average() redo it exactly when next asked
+        else:
+            # Also catches NaN and inf, which float() happily parses from "nan" and "inf".
+            # _checked_fsum raises for those and for a total that overflows (e.g. 1e308
+            # twice) before the grade is stored.
+            total = _checked_fsum(chain(self.grades, (g,)))
+            self._exact = True
+        self._sum = total
+        self.grades.append(g)
+        # Same as _grades_changed(), inlined since this is the hot path
+        self._grades_repr_cache = None
+        owner = self._owner
+        if owner is not None:
+            owner._gpa_dirty = True
+            owner._unsaved = True
 
     def remove_all_grades(self) -> None:
-        self.grades.clear() # Clears all the grades if user wants to remove grades
+        del self.grades[:] # Clears all the grades if user wants to remove grades
+        self._sum = 0.0
+        self._exact = True
+        self._grades_changed()
+
+    def _grades_changed(self) -> None:
+        # Drop everything derived from the grades: the display text here and the owner's GPA
+        self._grades_repr_cache = None
+        if self._owner is not None:
+            self._owner.mark_changed()
+
+    def total(self) -> float:
+        # Exact sum of the grades -- math.fsum(self.grades), the value a save/load round
+        # trip computes -- so averages don't drift with rounding error over many adds
+        if not self._exact:
+            self._sum = math.fsum(self.grades)
+            self._exact = True
+        return self._sum
 
     def average(self) -> Optional[float]:
         # Return avg grade in this course, or N/A if no grades
         if not self.grades:
             return None
-        return sum(self.grades) / len(self.grades)
+        if not self._exact:
+            self._sum = math.fsum(self.grades) # Same as total(), inlined for gpa()
+            self._exact = True
+        return self._sum / len(self.grades)
 
     def to_dict(self) -> List[float]:
         # Convert the course object into dictionary for saving to JSON
-        return list(self.grades)
+        return self.grades.tolist() # Converts the packed doubles in one C call
 
     @staticmethod
-    def from_list(name: str, grades: List[float]) -> "Course":
+    def from_list(name: str, grades: List[float], owner: Optional[Student] = None) -> "Course":
         # This is helping to rebuild a course object from a directory (when loading in a JSON).
-        c = Course(name)
-        for g in grades:
-            c.add_grade(g)
+        # Used for every loaded course, so it sets the slots directly instead of calling __init__.
+        c = Course.__new__(Course)
+        c.name = sys.intern(name)
+        try:
+            c.grades = array("d", grades) # Converts and type-checks every grade in one C-level pass
+        except TypeError:
+            raise ValueError("Grade must be numeric.") from None
+        c._sum = _checked_fsum(c.grades) # Exact total and NaN/inf check in one pass (json accepts NaN/Infinity)
+        c._exact = True
+        c._grades_repr_cache = None
+        c._owner = owner
         return c
 
+    def grades_str(self) -> str:
+        # Grades formatted like a list, e.g. "[90.0, 85.5]". Cached until the grades change.
+        if self._grades_repr_cache is None:
+            self._grades_repr_cache = "[" + ", ".join(map(repr, self.grades)) + "]"
+        return self._grades_repr_cache
+
     def __repr__(self) -> str:
         avg = self.average()
         avg_str = f"{avg:.2f}" if avg is not None else "N/A"
-        return f"{self.name}: grades={self.grades} avg={avg_str}"
+        return f"{self.name}: grades={self.grades_str()} avg={avg_str}"
 
 
 # -------------------
@@ -73,34 +252,66 @@ class Course:
 # Represents a student with an name, ID, and a set of courses
 # Student is called by name
 class Student:
+    __slots__ = ("name", "student_id", "courses", "_sorted_courses", "_gpa_cache", "_gpa_dirty", "_unsaved") # No per-instance __dict__
+
     def __init__(self, name: str, student_id: str):
         self.name = name
         self.student_id = student_id
         self.courses: Dict[str, Course] = {} # Dictionary: name -> course object
+        self._sorted_courses: List[str] = [] # Course names kept in sorted order for display
+        self._gpa_cache: Optional[float] = None # Last computed GPA
+        self._gpa_dirty = True # Set whenever courses or grades change, so gpa() recomputes
+        self._unsaved = True # Changed since the last save/load (a new student always is)
 
     def enroll_course(self, course_name: str) -> None:
         # Enrolls student in course given by user. If student is already enrolled, tell user.
+        course_name = sys.intern(course_name) # Every student's key for this course is the same str object
         if course_name in self.courses:
             raise ValueError(f"{self.name} is already enrolled in '{course_name}'.")
-        self.courses[course_name] = Course(course_name)
+        self.courses[course_name] = Course(course_name, self)
+        insort(self._sorted_courses, course_name)
+        self._gpa_dirty = True
+        self._unsaved = True
 
     def remove_course(self, course_name: str) -> None:
         # Removes a course from student. If course is not found in dictionary, tell user and exit.
-        if course_name not in self.courses:
+        # A removed Course object keeps pointing here; changing it later only costs one extra recompute
+        if self.courses.pop(course_name, None) is None:
             raise ValueError(f"{self.name} is not enrolled in '{course_name}'.")
-        del self.courses[course_name]
+        names = self._sorted_courses
+        i = bisect_left(names, course_name)
+        if i < len(names) and names[i] == course_name:
+            del names[i]
+        else: # self.courses was changed directly, so the index is out of step: rebuild it
+            self._sorted_courses = sorted(self.courses)
+        self._gpa_dirty = True
+        self._unsaved = True
 
     def add_grade(self, course_name: str, grade: float) -> None:
         # Assign grade to specific course if student is enrolled in course
-        if course_name not in self.courses:
+        course = self.courses.get(course_name)
+        if course is None:
             raise ValueError(f"{self.name} is not enrolled in '{course_name}'.")
-        self.courses[course_name].add_grade(grade)
+        course.add_grade(grade) # The course marks this student's GPA stale itself
+
+    def sorted_courses(self) -> Iterator[tuple]:
+        # (course name, Course) pairs in course name order, read off the kept index. If that no
+        # longer lists exactly the keys of self.courses (changed directly), it is rebuilt and the
+        # cached GPA dropped, since courses it never heard about may have been added.
+        names = self._sorted_courses
+        courses = self.courses
+        if len(names) != len(courses) or not all(map(courses.__contains__, names)):
+            names = self._sorted_courses = sorted(courses)
+            self._gpa_dirty = True
+            self._unsaved = True
+        return ((name, courses[name]) for name in names)
 
     def course_average(self, course_name: str) -> Optional[float]:
         # Calculate course average from all courses.
-        if course_name not in self.courses:
+        course = self.courses.get(course_name)
+        if course is None:
             raise ValueError(f"{self.name} is not enrolled in '{course_name}'.")
-        return self.courses[course_name].average()
+        return course.average()
 
     def gpa(self) -> Optional[float]:
         """
@@ -111,24 +322,48 @@ class Student:
           70-79  = 2.0
           60-69  = 1.0
           <60    = 0.0
+        The result is cached until the student's courses or grades change.
         """
-        gpa_points = []
+        if not self._gpa_dirty:
+            return self._gpa_cache
+        avgs = []
         for c in self.courses.values():
             avg = c.average()
             if avg is not None:
-                if avg >= 90:
-                    gpa_points.append(4.0)
-                elif avg >= 80:
-                    gpa_points.append(3.0)
-                elif avg >= 70:
-                    gpa_points.append(2.0)
-                elif avg >= 60:
-                    gpa_points.append(1.0)
-                else:
-                    gpa_points.append(0.0)
-        if not gpa_points:
-            return None
-        return sum(gpa_points) / len(gpa_points)
+                avgs.append(avg)
+        return self._gpa_from(avgs)
+
+    def mark_changed(self) -> None:
+        # Called by this student's Course objects when their grades change
+        self._gpa_dirty = True
+        self._unsaved = True
+
+    def needs_save(self) -> bool:
+        # True if this student changed since the last save/load
+        return self._unsaved
+
+    def mark_saved(self) -> None:
+        self._unsaved = False
+
+    def course_rows(self) -> Iterator[Tuple[str, Course, Optional[float]]]:
+        # Yields (course name, course, average) for display. Once fully consumed it also
+        # fills the GPA cache from those same averages, so a following gpa() is free.
+        avgs: List[float] = []
+        for cname, course in self.sorted_courses():
+            avg = course.average()
+            if avg is not None:
+                avgs.append(avg)
+            yield cname, course, avg
+        if self._gpa_dirty:
+            self._gpa_from(avgs)
+
+    def _gpa_from(self, avgs: List[float]) -> Optional[float]:
+        # Computes and caches the GPA from the given course averages
+        # bisect_right counts the cutoffs at or below avg, which is exactly its GPA points (0-4)
+        total = sum(map(partial(bisect_right, _GPA_CUTOFFS), avgs))
+        self._gpa_cache = total / len(avgs) if avgs else None
+        self._gpa_dirty = False
+        return self._gpa_cache
 
     def to_dict(self) -> dict:
         # Convert the student object into dictionary for saving to JSON.
@@ -140,9 +375,16 @@ class Student:
     @staticmethod
     def from_dict(name: str, data: dict) -> "Student":
         # pull student_id from JSON, default to "N/A" if missing (for backward compatibility)
-        s = Student(name, data["student_id"])
-        for cname, grades in data.get("courses", {}).items():
-            s.courses[cname] = Course.from_list(cname, grades)
+        # Built with __new__ and one dict comprehension to skip per-course method calls on load.
+        s = Student.__new__(Student)
+        s.name = name
+        s.student_id = data["student_id"]
+        # JSON-loaded strings aren't interned on their own; from_list interns Course.name to the same object
+        s.courses = {sys.intern(cname): Course.from_list(cname, grades, s) for cname, grades in data.get("courses", {}).items()}
+        s._sorted_courses = sorted(s.courses)
+        s._gpa_cache = None
+        s._gpa_dirty = True
+        s._unsaved = False # Matches the file it is being loaded from
         return s
 
 
@@ -150,6 +392,110 @@ class Student:
         return f"Student(name={self.name!r}, courses={list(self.courses)})"
 
 
+# ----------------------------
+# JSON encoding hook
+# ----------------------------
+# Lets the JSON (and msgpack) encoder write Course/Student objects directly,
+# so saving does not build a throwaway to_dict() copy of every student first.
+def _json_default(obj):
+    if isinstance(obj, Course):
+        return obj.grades.tolist()
+    if isinstance(obj, Student):
+        return {"student_id": obj.student_id, "courses": obj.courses}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# ----------------------------
+# JSON file helpers
+# ----------------------------
+# Shared by the whole-file and the per-student (incremental) save/load paths.
+def _write_json(path: str, data, pretty: bool = False) -> None:
+    # Writes to a temp file first and swaps it in with os.replace, so a crash
+    # part-way through never leaves a half-written file behind.
+    tmp = path + ".tmp"
+    try:
+        if _fastjson is not None:
+            # orjson returns bytes, so the file is opened in binary mode
+            option = _fastjson.OPT_INDENT_2 if pretty else 0
+            with open(tmp, "wb", buffering=_WRITE_BUFFER) as f:
+                f.write(_fastjson.dumps(data, default=_json_default, option=option))
+        else:
+            with open(tmp, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
+                if pretty:
+                    json.dump(data, f, indent=2, default=_json_default) # Adds to file
+                else:
+                    json.dump(data, f, separators=(",", ":"), default=_json_default)
+        os.replace(tmp, path)
+    except BaseException: # Encoding failed or was interrupted: don't leave the temp file behind
+        _remove_quietly(tmp)
+        raise
+
+
+def _write_students_stream(path: str, students) -> None:
+    # Compact orjson save written one student at a time, so the encoded file never
+    # has to exist as one big bytes object. Output is byte-identical to
+    # orjson.dumps({"students": ...}). students is an iterable of (key, Student).
+    tmp = path + ".tmp"
+    try:
+        dumps = _fastjson.dumps
+        with open(tmp, "wb", buffering=_WRITE_BUFFER) as f:
+            f.write(b'{"students":{')
+            first = True
+            for key, s in students:
+                if not first:
+                    f.write(b",")
+                first = False
+                f.write(dumps(key))
+                f.write(b":")
+                f.write(dumps(s, default=_json_default))
+            f.write(b"}}")
+        os.replace(tmp, path)
+    except BaseException: # Encoding failed or was interrupted: don't leave the temp file behind
+        _remove_quietly(tmp)
+        raise
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError: # Never created, or already gone
+        pass
+
+
+def _read_json(path: str):
+    if _fastjson is not None:
+        with open(path, "rb") as f:
+            return _fastjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# Per-student file names for incremental_save_json: the key percent-encoded, with every
+# uppercase ASCII letter escaped too and the %XX escapes in lowercase, so the name has no
+# uppercase at all. "Bob" and "bob" then never share a file on case-insensitive file
+# systems (Windows, macOS). unquote() reverses it.
+_CASE_ESCAPES = re.compile(r"%[0-9A-F]{2}|[A-Z]")
+
+def _student_filename(key: str) -> str:
+    return _CASE_ESCAPES.sub(_escape_case, quote(key, safe="")) + ".json"
+
+def _escape_case(m: re.Match) -> str:
+    text = m.group()
+    return text.lower() if text[0] == "%" else f"%{ord(text):02x}"
+
+# incremental_save_json also keeps this file in its folder: a JSON list of the student
+# files it wrote there. Only files named in it are ever deleted, so pointing the method
+# at a folder holding other .json files (config.json, a students.json save) is harmless.
+_MANIFEST = "students.manifest"
+
+def _read_manifest(directory: str) -> Optional[Set[str]]:
+    # Student file names listed in directory's manifest, or None if it has none
+    path = os.path.join(directory, _MANIFEST)
+    if not os.path.exists(path):
+        return None
+    return set(_read_json(path))
+
+
 # ----------------------------
 # Class: GradeManager
 # ----------------------------
@@ -157,21 +503,29 @@ class Student:
 class GradeManager:
     def __init__(self):
         self.students: Dict[str, Student] = {}  # key = name
+        self._sorted_names: List[str] = [] # Student names kept in sorted order for display_all
+        self._clean_path: Optional[str] = None # File or folder last saved/loaded, known to match memory
 
     # -------------------
     # Student Management
     # -------------------
     def add_student(self, name: str, student_id: str) -> None:
         # Add student if ID does not exist in dictionary
-        if name in self.students:
+        s = Student(name, student_id)
+        if self.students.setdefault(name, s) is not s: # One lookup both checks and inserts
             raise ValueError(f"Student '{name}' already exists.")
-        self.students[name] = Student(name, student_id)
+        insort(self._sorted_names, name)
 
     def remove_student(self, name: str) -> None:
         # Remove student if ID does exist in dictionary
-        if name not in self.students:
+        if self.students.pop(name, None) is None:
             raise ValueError(f"Student '{name}' not found.")
-        del self.students[name]
+        keys = self._sorted_names
+        i = bisect_left(keys, name)
+        if i < len(keys) and keys[i] == name:
+            del keys[i]
+        else: # self.students was changed directly, so the index is out of step: rebuild it
+            self._sorted_names = sorted(self.students)
 
     # -------------------
     # Course Options
@@ -196,54 +550,233 @@ class GradeManager:
         # Gets student GPA
         return self._get_student(name).gpa()
 
+    def bulk_gpas(self) -> Dict[str, Optional[float]]:
+        # GPA for every student, keyed by name. With numba installed, all
+        # course totals are packed into flat arrays and reduced by one compiled kernel
+        # instead of per-student loops.
+        kernel = _bulk_kernel()
+        if kernel is None or not self.students:
+            return {k: s.gpa() for k, s in self.students.items()}
+        keys = list(self.students)
+        sums = array("d") # Exact grade total of every course, student by student
+        counts = array("q") # Number of grades in each of those courses
+        s_offsets = array("q", [0]) # Student i's courses are sums[s_offsets[i]:s_offsets[i + 1]]
+        for k in keys:
+            for course in self.students[k].courses.values():
+                sums.append(course.total())
+                counts.append(len(course.grades))
+            s_offsets.append(len(sums))
+        if not sums:
+            return dict.fromkeys(keys)
+        gpas = kernel(
+            _np.frombuffer(sums, dtype=_np.float64),
+            _np.frombuffer(counts, dtype=_np.int64),
+            _np.frombuffer(s_offsets, dtype=_np.int64),
+        )
+        return {k: (None if math.isnan(g) else float(g)) for k, g in zip(keys, gpas)}
+
     # ---------------------
     # Display methods
     # ---------------------
     def display_student(self, name: str) -> str:
         # Print one student's info, their courses, and grades.
-        s = self._get_student(name)
-        lines = [f"Name: {s.name}", f"Student ID: {s.student_id}"]
-        if not s.courses:
-            lines.append("  (no courses)")
-        else:
-            for cname in sorted(s.courses):
-                course = s.courses[cname]
-                avg = course.average()
-                avg_str = f"{avg:.2f}" if avg is not None else "N/A"
-                lines.append(f"  - {cname}: grades={course.grades} | avg={avg_str}")
-        g = s.gpa()
-        gpa_str = f"{g:.2f}" if g is not None else "N/A"
-        lines.append(f"  Overall GPA: {gpa_str}")
-        return "\n".join(lines)
+        return "\n".join(self._student_lines(self._get_student(name)))
 
     def display_all(self) -> str:
         # Print all students and their info if it exists
         if not self.students:
             return "(no students)"
-        return "\n\n".join([self.display_student(name) for name in sorted(self.students)])
+        return "\n".join(self._all_lines()) # Lines are generated straight into one join
+
+    def print_all(self, file: Optional[TextIO] = None) -> None:
+        # Same text as display_all(), written line by line (stdout by default)
+        # so the whole report never has to be held in memory at once.
+        out = sys.stdout if file is None else file
+        if not self.students:
+            out.write("(no students)\n")
+            return
+        for line in self._all_lines():
+            out.write(line)
+            out.write("\n")
+
+    def _all_lines(self) -> Iterator[str]:
+        # Yields every student's display lines, with a blank line between students
+        first = True
+        for name in self._sorted_keys():
+            if not first:
+                yield ""
+            first = False
+            yield from self._student_lines(self.students[name])
+
+    def _student_lines(self, s: Student) -> Iterator[str]:
+        # Yields the display lines for one student
+        yield f"Name: {s.name}"
+        yield f"Student ID: {s.student_id}"
+        if not s.courses:
+            yield "  (no courses)"
+        for cname, course, avg in s.course_rows():
+            avg_str = f"{avg:.2f}" if avg is not None else "N/A"
+            yield f"  - {cname}: grades={course.grades_str()} | avg={avg_str}"
+        g = s.gpa() # Cached by course_rows() above
+        gpa_str = f"{g:.2f}" if g is not None else "N/A"
+        yield f"  Overall GPA: {gpa_str}"
 
     # -----------------------
     # Persistence (Save/Load)
     # -----------------------
-    def save_json(self, path: str) -> None:
-        # Save all student data to JSON file.
-        data = {
-            "students": {name: s.to_dict() for name, s in sorted(self.students.items())}
-        }# Places it into a dictionary
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2) # Adds to file
+    def save(self, path: str) -> None:
+        # Save in the format named by the file extension: msgpack for .msgpack/.mp, JSON otherwise
+        if path.lower().endswith(_MSGPACK_EXTS):
+            self.save_msgpack(path)
+        else:
+            self.save_json(path)
+
+    def load(self, path: str) -> None:
+        # Load a file written by save(), choosing the format the same way
+        if path.lower().endswith(_MSGPACK_EXTS):
+            self.load_msgpack(path)
+        else:
+            self.load_json(path)
+
+    def save_json(self, path: str, pretty: bool = False) -> None:
+        # Save all student data to JSON file. Compact by default; pretty=True indents it for reading.
+        path = os.path.abspath(path)
+        if _fastjson is not None and not pretty:
+            _write_students_stream(path, self._sorted_items())
+        else:
+            data = {"students": dict(self._sorted_items())} # Students are encoded by _json_default
+            _write_json(path, data, pretty)
+        self._mark_clean(path)
 
     def load_json(self, path: str) -> None:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        self.students.clear()
-        for name, sdict in data.get("students", {}).items():
-            self.students[name] = Student.from_dict(name, sdict)
+        if _ijson is not None and os.path.getsize(path) >= _STREAM_LOAD_MIN:
+            # Stream students one at a time so the whole parsed document is never held at once
+            with open(path, "rb") as f:
+                self._load_items(_ijson.kvitems(f, "students", use_float=True), path)
+            return
+        self._load_data(_read_json(path), path)
+
+    def save_msgpack(self, path: str) -> None:
+        # Same layout as save_json, but in binary msgpack: grades are stored as raw
+        # 8-byte doubles, so files are smaller and loading skips number parsing.
+        if _msgpack is None:
+            raise ImportError("Saving as msgpack needs the msgpack package (pip install msgpack).")
+        path = os.path.abspath(path)
+        data = {"students": dict(self._sorted_items())} # Students are encoded by _json_default
+        tmp = path + ".tmp"
+        try:
+            with open(tmp, "wb", buffering=_WRITE_BUFFER) as f:
+                _msgpack.pack(data, f, default=_json_default, use_bin_type=True)
+            os.replace(tmp, path)
+        except BaseException: # Encoding failed or was interrupted: don't leave the temp file behind
+            _remove_quietly(tmp)
+            raise
+        self._mark_clean(path)
+
+    def load_msgpack(self, path: str) -> None:
+        if _msgpack is None:
+            raise ImportError("Loading msgpack needs the msgpack package (pip install msgpack).")
+        with open(path, "rb") as f:
+            data = _msgpack.unpack(f, raw=False)
+        self._load_data(data, path)
+
+    def _load_data(self, data: dict, path: str) -> None:
+        # Rebuild every student from a decoded {"students": ...} document read from path
+        self._load_items(data.get("students", {}).items(), path)
+
+    def _load_items(self, items, path: str) -> None:
+        # Rebuild every student from (key, student dict) pairs read from path
+        students: Dict[str, Student] = {}
+        for name, sdict in items:
+            students[name] = Student.from_dict(name, sdict)
+        self._replace_roster(students, os.path.abspath(path))
+
+    def incremental_save_json(self, directory: str) -> None:
+        # Save into a folder holding one <name>.json file per student plus a manifest of those
+        # files. When the folder is the one last saved/loaded, only students changed since then
+        # are rewritten or deleted.
+        directory = os.path.abspath(directory)
+        owned = _read_manifest(directory) if os.path.isdir(directory) else None
+        if directory == self._clean_path and owned is not None:
+            # Rewrite every student changed since then (or not in the manifest yet, e.g. put
+            # into self.students directly) and delete files of students no longer there
+            keep = set()
+            for name, s in self.students.items():
+                fname = _student_filename(name)
+                keep.add(fname)
+                if s.needs_save() or fname not in owned:
+                    _write_json(os.path.join(directory, fname), s)
+            for fname in owned - keep:
+                fpath = os.path.join(directory, fname)
+                if os.path.exists(fpath):
+                    os.remove(fpath)
+            owned = keep
+        else:
+            # Any other folder gets every student written out. Student files an earlier save
+            # listed in the manifest but no longer in the roster are removed, so a reload
+            # doesn't bring them back; nothing else in the folder is touched.
+            os.makedirs(directory, exist_ok=True)
+            written = set()
+            for name, s in self.students.items():
+                fname = _student_filename(name)
+                _write_json(os.path.join(directory, fname), s)
+                written.add(fname)
+            for fname in (owned or set()) - written:
+                fpath = os.path.join(directory, fname)
+                if os.path.exists(fpath):
+                    os.remove(fpath)
+            owned = written
+        _write_json(os.path.join(directory, _MANIFEST), sorted(owned))
+        self._mark_clean(directory)
+
+    def incremental_load_json(self, directory: str) -> None:
+        # Load a folder written by incremental_save_json: the files its manifest lists, or
+        # every .json file in a folder saved before manifests were written.
+        directory = os.path.abspath(directory)
+        owned = _read_manifest(directory)
+        files = owned if owned is not None else [f for f in os.listdir(directory) if f.endswith(".json")]
+        students: Dict[str, Student] = {}
+        for f in files:
+            name = unquote(f[:-5])
+            students[name] = Student.from_dict(name, _read_json(os.path.join(directory, f)))
+        # A folder without a manifest isn't treated as up to date, so the next
+        # incremental_save_json there writes every student and starts one
+        self._replace_roster(students, directory if owned is not None else None)
+
+    def _replace_roster(self, students: Dict[str, Student], path: Optional[str]) -> None:
+        # Swap in a fully loaded roster. Loads build into a new dict and only call this once
+        # every student has been read, so a load that fails partway leaves the old roster,
+        # its sorted index and its dirty tracking untouched.
+        self.students = students
+        self._sorted_names = sorted(students)
+        self._mark_clean(path)
+
+    def _sorted_items(self) -> Iterator[tuple]:
+        # Every (name, Student) pair of self.students in name order. The kept index saves a sort,
+        # but _sorted_keys() checks it first, so what gets saved always comes from the real dict.
+        students = self.students
+        return ((name, students[name]) for name in self._sorted_keys())
+
+    def _mark_clean(self, path: Optional[str]) -> None:
+        # Memory now matches what is stored at path
+        for s in self.students.values():
+            s.mark_saved()
+        self._clean_path = path
+
+    def _sorted_keys(self) -> List[str]:
+        # The kept sorted key index, rebuilt first if it no longer lists exactly the keys of
+        # self.students (a public dict that callers may change directly)
+        keys = self._sorted_names
+        students = self.students
+        if len(keys) != len(students) or not all(map(students.__contains__, keys)):
+            keys = self._sorted_names = sorted(students)
+        return keys
 
     def _get_student(self, name: str) -> Student:
-        if name not in self.students:
+        s = self.students.get(name)
+        if s is None:
             raise ValueError(f"Student '{name}' not found.")
-        return self.students[name]
+        return s
 
 
 # Helpers
@@ -254,33 +787,43 @@ def _prompt(msg: str) -> str:
 
 # Float prompt
 # If the number is not a float, the error is given to user.
+# A plain decimal/scientific-notation check filters bad input up front, instead of
+# letting float() raise and catching the exception.
+_NUM_RE = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+
 def _prompt_float(msg: str) -> float:
     while True:
-        try:
-            return float(_prompt(msg))
-        except ValueError:
-            print("Please enter a valid number.")
+        s = _prompt(msg)
+        if _NUM_RE.fullmatch(s):
+            return float(s)
+        print("Please enter a valid number.")
 
 
 # ---------------
 # Main Program (Menu-driven)
 # ---------------
+# Menu text, printed with a single write each time around the loop
+_MENU_TEXT = (
+    "\n======== Student Grade Management System ========\n"
+    "1. Add student\n"
+    "2. Remove student\n"
+    "3. Enroll student in a course\n"
+    "4. Remove a course from a student\n"
+    "5. Add grade for a course\n"
+    "6. Display student info\n"
+    "7. Display all students\n"
+    "8. Save data\n"
+    "9. Load data\n"
+    "10. Exit\n"
+)
+
 def _menu() -> None:
     gm = GradeManager()
     FILENAME = "students.json"
 
     while True:
-        print("\n======== Student Grade Management System ========")
-        print("1. Add student")
-        print("2. Remove student")
-        print("3. Enroll student in a course")
-        print("4. Remove a course from a student")
-        print("5. Add grade for a course")
-        print("6. Display student info")
-        print("7. Display all students")
-        print("8. Save data")
-        print("9. Load data")
-        print("10. Exit")
+        sys.stdout.write(_MENU_TEXT) # One write per loop instead of eleven print() calls
+        sys.stdout.flush()
 
         choice = _prompt("Select an option (1-10): ")
         try:
@@ -314,14 +857,14 @@ def _menu() -> None:
                 name = _prompt("Enter student name: ")
                 print(gm.display_student(name))
             elif choice == "7":
-                print(gm.display_all())
+                gm.print_all()
             elif choice == "8":
                 path = _prompt(f"Enter filename to save [{FILENAME}]: ") or FILENAME
-                gm.save_json(path)
+                gm.save(path) # .msgpack/.mp saves as binary msgpack, anything else as JSON
                 print(f"Data saved to '{path}'.")
             elif choice == "9":
                 path = _prompt(f"Enter filename to load [{FILENAME}]: ") or FILENAME
-                gm.load_json(path)
+                gm.load(path)
                 print(f"Data loaded from '{path}'.")
             elif choice == "10":
                 print("Exiting...")
@@ -0,0 +1,108 @@
+"""
+GradeManager.bulk_gpas() must give the same GPA as Student.gpa() for every student,
+in both the name-keyed and the ID-keyed program. With numba installed this checks the
+compiled kernel; without it, bulk_gpas() falls back to Student.gpa() itself.
+
+Run from waterfall/code with:  python -m unittest discover tests
+"""
+import importlib.util
+import os
+import random
+import sys
+import unittest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "IDs"))
+
+import grade_manager
+import grade_manager_with_IDs
+
+MODULES = (grade_manager, grade_manager_with_IDs)
+
+
+def _add(gm, name, student_id, courses):
+    # Adds a student with courses {course_name: [grades]}; returns the key gm uses for them
+    if isinstance(gm, grade_manager.GradeManager):
+        key = name
+        gm.add_student(name, student_id)
+    else:
+        key = student_id
+        gm.add_student(student_id, name)
+    for cname, grades in courses.items():
+        gm.enroll_student_in_course(key, cname)
+        for g in grades:
+            gm.add_grade(key, cname, g)
+    return key
+
+
+def _on_cutoff_grades(rng):
+    # Two-decimal grades whose exact decimal average is 60, 70, 80 or 90. Their float
+    # sum lands just above or just below the cutoff, which is what used to split
+    # the compiled kernel from Student.gpa().
+    n = rng.randint(2, 6)
+    target = rng.choice((60, 70, 80, 90)) * n * 100
+    cents = [rng.randint(5000, 10000) for _ in range(n - 1)]
+    last = target - sum(cents)
+    if not 0 <= last <= 10000:
+        return [rng.randint(0, 10000) / 100 for _ in range(n)]
+    return [c / 100 for c in cents + [last]]
+
+
+class BulkGpasMatchStudentGpa(unittest.TestCase):
+    def _check(self, gm):
+        expected = {k: s.gpa() for k, s in gm.students.items()}
+        self.assertEqual(gm.bulk_gpas(), expected)
+
+    def test_average_on_cutoff(self):
+        for mod in MODULES:
+            with self.subTest(module=mod.__name__):
+                gm = mod.GradeManager()
+                key = _add(gm, "Ann", "1", {"Math": [99.27, 85.02, 89.13, 86.58]}) # Averages 90.00
+                self.assertEqual(gm.display_student(key).splitlines()[-1], "  Overall GPA: 4.00")
+                self._check(gm)
+
+    def test_random_roster(self):
+        for mod in MODULES:
+            with self.subTest(module=mod.__name__):
+                rng = random.Random(3000)
+                gm = mod.GradeManager()
+                for i in range(3000):
+                    courses = {f"C{c}": _on_cutoff_grades(rng) for c in range(rng.randint(0, 5))}
+                    if courses and rng.random() < 0.1:
+                        courses["Empty"] = [] # A course without grades is left out of the GPA
+                    _add(gm, f"S{i:04d}", f"{i:04d}", courses)
+                self._check(gm)
+
+    def test_empty_rosters(self):
+        for mod in MODULES:
+            with self.subTest(module=mod.__name__):
+                gm = mod.GradeManager()
+                self.assertEqual(gm.bulk_gpas(), {})
+                _add(gm, "Ann", "1", {"Math": []})
+                self._check(gm)
+
+    def test_huge_averages(self):
+        # Averages past the int64 range must still land in the top band, not wrap around
+        for mod in MODULES:
+            with self.subTest(module=mod.__name__):
+                gm = mod.GradeManager()
+                for i, avg in enumerate((1e19, 9.3e18, 1e300)):
+                    _add(gm, f"S{i}", str(i), {"Math": [avg], "Art": [50.0]})
+                self._check(gm)
+                self.assertEqual(set(gm.bulk_gpas().values()), {2.0})
+
+    def test_warm_up(self):
+        # warm_up_bulk_gpas() loads the kernels up front and reports whether numba is there
+        has_numba = importlib.util.find_spec("numba") is not None
+        for mod in MODULES:
+            with self.subTest(module=mod.__name__):
+                self.assertIs(mod.warm_up_bulk_gpas(), has_numba)
+                self.assertIs(mod.warm_up_bulk_gpas(), has_numba) # Safe to call again
+                gm = mod.GradeManager()
+                _add(gm, "Ann", "1", {"Math": [90.0]})
+                self._check(gm)
+
+
+if __name__ == "__main__":
+    unittest.main()
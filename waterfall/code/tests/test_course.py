@@ -0,0 +1,76 @@
+"""
+Course grades and the Student GPA cached from them, in both the name-keyed and the
+ID-keyed program: a grade change always reaches the cached GPA, and a rejected grade
+leaves the course exactly as it was.
+
+Run from waterfall/code with:  python -m unittest discover tests
+"""
+import math
+import unittest
+
+from test_bulk_gpas import MODULES, _add
+
+
+class CourseGrades(unittest.TestCase):
+    def test_course_change_invalidates_gpa(self):
+        # Grades changed on the Course object itself, not through Student/GradeManager
+        for mod in MODULES:
+            with self.subTest(module=mod.__name__):
+                gm = mod.GradeManager()
+                key = _add(gm, "Ann", "1", {"Math": [95.0], "Art": [85.0]})
+                s = gm.students[key]
+                self.assertEqual(s.gpa(), 3.5)
+                s.courses["Art"].add_grade(100.0) # Art now averages 92.5
+                self.assertEqual(s.gpa(), 4.0)
+                s.courses["Math"].remove_all_grades() # Courses without grades are left out
+                self.assertEqual(s.gpa(), 4.0)
+                s.courses["Art"].remove_all_grades()
+                self.assertIsNone(s.gpa())
+                self.assertEqual(gm.display_student(key).splitlines()[-1], "  Overall GPA: N/A")
+
+    def test_loaded_course_change_invalidates_gpa(self):
+        for mod in MODULES:
+            with self.subTest(module=mod.__name__):
+                gm = mod.GradeManager()
+                key = _add(gm, "Ann", "1", {"Math": [50.0]})
+                s = mod.Student.from_dict(key, gm.students[key].to_dict())
+                self.assertEqual(s.gpa(), 0.0)
+                s.courses["Math"].add_grade(100.0)
+                self.assertEqual(s.gpa(), 2.0)
+
+    def test_rejected_grade_leaves_course_unchanged(self):
+        for mod in MODULES:
+            for first in (1e308, 5.0):
+                with self.subTest(module=mod.__name__, first=first):
+                    gm = mod.GradeManager()
+                    key = _add(gm, "Ann", "1", {"Math": [first]})
+                    s = gm.students[key]
+                    course = s.courses["Math"]
+                    gpa = s.gpa()
+                    bad = [float("nan"), float("inf"), "nan", "-inf", "abc", None]
+                    if first == 1e308:
+                        bad.append(1e308) # The total would overflow
+                    for grade in bad:
+                        with self.assertRaises(ValueError):
+                            course.add_grade(grade)
+                        self.assertEqual(list(course.grades), [first])
+                        self.assertEqual(course.total(), first)
+                        self.assertEqual(course.average(), first)
+                        self.assertEqual(s.gpa(), gpa)
+                    course.add_grade(-first) # The course still takes grades afterwards
+                    self.assertEqual(course.total(), 0.0)
+
+    def test_total_is_exact(self):
+        # Adding one grade at a time gives the same total as adding them all at once
+        for mod in MODULES:
+            with self.subTest(module=mod.__name__):
+                grades = [0.1] * 10 + [1e16, 1.0, -1e16]
+                course = mod.Course("Math")
+                for g in grades:
+                    course.add_grade(g)
+                self.assertEqual(course.total(), math.fsum(grades))
+                self.assertEqual(course.total(), mod.Course.from_list("Math", grades).total())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+Saving and loading, in both the name-keyed and the ID-keyed program: what is saved
+comes back the same, failed saves and loads change nothing, and incremental_save_json
+only ever deletes the student files it wrote itself.
+
+Run from waterfall/code with:  python -m unittest discover tests
+"""
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from test_bulk_gpas import MODULES, _add, _on_cutoff_grades
+
+
+def _course_state(gm):
+    # {key: {course: (grades, total, average)}} for comparing rosters
+    return {k: {c: (list(course.grades), course.total(), course.average()) for c, course in s.courses.items()}
+            for k, s in gm.students.items()}
+
+
+class SaveLoadRoundTrip(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _roster(self, mod):
+        rng = random.Random(42)
+        gm = mod.GradeManager()
+        for i in range(200):
+            _add(gm, f"S{i:03d}", f"{i:03d}", {f"C{c}": _on_cutoff_grades(rng) for c in range(rng.randint(0, 4))})
+        return gm
+
+    def test_averages_survive_save_load(self):
+        # A course total kept while adding grades one by one must equal the one a load computes
+        for mod in MODULES:
+            gm = self._roster(mod)
+            paths = [("save_json", "load_json", os.path.join(self.dir, f"{mod.__name__}.json")),
+                     ("incremental_save_json", "incremental_load_json", os.path.join(self.dir, mod.__name__))]
+            if mod._msgpack is not None:
+                paths.append(("save_msgpack", "load_msgpack", os.path.join(self.dir, f"{mod.__name__}.msgpack")))
+            for save, load, path in paths:
+                with self.subTest(module=mod.__name__, save=save):
+                    getattr(gm, save)(path)
+                    loaded = mod.GradeManager()
+                    getattr(loaded, load)(path)
+                    self.assertEqual(_course_state(loaded), _course_state(gm))
+                    self.assertEqual(loaded.display_all(), gm.display_all())
+                    self.assertEqual(loaded.bulk_gpas(), gm.bulk_gpas())
+
+    def test_direct_changes_are_saved(self):
+        # Changes made on Student/Course objects, not through GradeManager, still reach the file
+        for mod in MODULES:
+            with self.subTest(module=mod.__name__):
+                for save, load, where in (("save_json", "load_json", os.path.join(self.dir, f"{mod.__name__}.json")),
+                                          ("incremental_save_json", "incremental_load_json", os.path.join(self.dir, mod.__name__))):
+                    gm = mod.GradeManager()
+                    key = _add(gm, "Ann", "1", {"Math": [80.0]})
+                    other = _add(gm, "Bob", "2", {})
+                    getattr(gm, save)(where)
+                    getattr(gm, save)(where) # Now up to date with the file
+                    s = gm.students[key]
+                    s.courses["Math"].add_grade(100.0)
+                    s.enroll_course("Art")
+                    s.add_grade("Art", 70.0)
+                    gm.students[other].enroll_course("Gym")
+                    getattr(gm, save)(where)
+                    loaded = mod.GradeManager()
+                    getattr(loaded, load)(where)
+                    self.assertEqual(list(loaded.students[key].courses["Math"].grades), [80.0, 100.0])
+                    self.assertEqual(list(loaded.students[key].courses["Art"].grades), [70.0])
+                    self.assertEqual(list(loaded.students[other].courses), ["Gym"])
+
+    def test_failed_load_keeps_roster(self):
+        for mod in MODULES:
+            with self.subTest(module=mod.__name__):
+                path = os.path.join(self.dir, f"{mod.__name__}.json")
+                gm = mod.GradeManager()
+                _add(gm, "Ann", "1", {"Math": [90.0]})
+                _add(gm, "Bob", "2", {"Art": [70.0]})
+                gm.save_json(path)
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+                data["students"][max(data["students"])]["courses"]["Bad"] = [80.0, "not a grade"]
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                other = mod.GradeManager()
+                _add(other, "Cy", "3", {"Math": [60.0]})
+                before = other.display_all()
+                with self.assertRaises(ValueError):
+                    other.load_json(path)
+                self.assertEqual(other.display_all(), before)
+
+    def test_failed_save_leaves_no_temp_file(self):
+        for mod in MODULES:
+            with self.subTest(module=mod.__name__):
+                gm = mod.GradeManager()
+                key = _add(gm, "Ann", "1", {})
+                gm.students[key].courses["Bad"] = object() # Not encodable
+                folder = os.path.join(self.dir, mod.__name__)
+                with self.assertRaises(Exception):
+                    gm.save_json(os.path.join(self.dir, "s.json"))
+                with self.assertRaises(Exception):
+                    gm.incremental_save_json(folder)
+                left = [f for _, _, files in os.walk(self.dir) for f in files]
+                self.assertFalse([f for f in left if f.endswith(".tmp")], left)
+
+
+class IncrementalSaveFiles(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _load(self, mod, folder):
+        gm = mod.GradeManager()
+        gm.incremental_load_json(folder)
+        return gm
+
+    def test_removed_students_stay_removed(self):
+        for mod in MODULES:
+            with self.subTest(module=mod.__name__):
+                folder = os.path.join(self.dir, mod.__name__)
+                gm = mod.GradeManager()
+                ann = _add(gm, "Ann", "1", {"Math": [90.0]})
+                bob = _add(gm, "Bob", "2", {"Art": [70.0]})
+                gm.incremental_save_json(folder)
+                gm.remove_student(bob)
+                gm.incremental_save_json(folder) # Same folder: only the change is applied
+                self.assertEqual(sorted(self._load(mod, folder).students), [ann])
+                # Another roster saved over the folder replaces it fully
+                other = mod.GradeManager()
+                cy = _add(other, "Cy", "3", {})
+                other.incremental_save_json(folder)
+                self.assertEqual(sorted(self._load(mod, folder).students), [cy])
+                # Students taken out of self.students directly are caught too
+                gm = self._load(mod, folder)
+                del gm.students[cy]
+                gm.incremental_save_json(folder)
+                self.assertEqual(self._load(mod, folder).students, {})
+
+    def test_other_files_in_folder_are_kept(self):
+        for mod in MODULES:
+            with self.subTest(module=mod.__name__):
+                folder = os.path.join(self.dir, mod.__name__)
+                os.makedirs(folder)
+                for fname in ("config.json", "students.json", "notes.txt"):
+                    with open(os.path.join(folder, fname), "w", encoding="utf-8") as f:
+                        f.write("{}")
+                gm = mod.GradeManager()
+                key = _add(gm, "Ann", "1", {})
+                gm.incremental_save_json(folder)
+                gm.remove_student(key)
+                gm.incremental_save_json(folder)
+                mod.GradeManager().incremental_save_json(folder) # Full write of an empty roster
+                self.assertEqual(sorted(f for f in os.listdir(folder) if not f.endswith(".manifest")),
+                                 ["config.json", "notes.txt", "students.json"])
+
+    def test_keys_differing_only_in_case(self):
+        # "Bob" and "bob" must get different files even where file names ignore case
+        for mod in MODULES:
+            with self.subTest(module=mod.__name__):
+                folder = os.path.join(self.dir, mod.__name__)
+                gm = mod.GradeManager()
+                upper = _add(gm, "Bob", "Bob", {"Math": [90.0]})
+                lower = _add(gm, "bob", "bob", {"Math": [50.0]})
+                gm.incremental_save_json(folder)
+                names = [f for f in os.listdir(folder) if f.endswith(".json")]
+                self.assertEqual(len({f.lower() for f in names}), 2, names)
+                loaded = self._load(mod, folder)
+                self.assertEqual(list(loaded.students[upper].courses["Math"].grades), [90.0])
+                self.assertEqual(list(loaded.students[lower].courses["Math"].grades), [50.0])
+
+
+if __name__ == "__main__":
+    unittest.main()